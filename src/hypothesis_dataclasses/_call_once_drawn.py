@@ -1,11 +1,10 @@
 """This module implements the `calloncedrawn` decorator."""
 
-import functools as _functools
-
 from typing import Callable as _Callable, ClassVar as _ClassVar, \
-    FrozenSet as _FrozenSet, Set as _Set, TypeVar as _TypeVar
+    FrozenSet as _FrozenSet, TypeVar as _TypeVar
 
-from ._scfunc_descriptor import SCFuncDescriptor as _SCFuncDescriptor
+from ._scfunc_descriptor import intern_fields as _intern_fields, \
+    SCFuncDescriptor as _SCFuncDescriptor
 
 
 _T = _TypeVar("_T")
@@ -18,17 +17,17 @@ class CallOnceDrawnFunctionDescriptor(_SCFuncDescriptor):
 
     __slots__ = ("fields",)
 
-    def __init__(self, fields: _Set[str], func: _Callable):
+    def __init__(self, fields: _FrozenSet[str], func: _Callable):
         """Construct a new `CallOnceDrawnFunctionDescriptor`.
 
         Args:
-            fields (Set[str]): The fields for which to call the function
-                after they have been drawn.
+            fields (FrozenSet[str]): The fields for which to call the
+                function after they have been drawn.
             func (Callable): The function to call. Must be wrapped in
                 @staticmethod or @classmethod.
         """
         super().__init__(func)
-        self.fields: _FrozenSet[str] = frozenset(fields)
+        self.fields: _FrozenSet[str] = fields
 
     _nparam_classmethod: _ClassVar[int] = 3
     """The number of expected parameters if the descriptor is applied to
@@ -95,8 +94,11 @@ def calloncedrawn(field: str, *fields: str) -> _Callable[[_T], _T]:
             "field name?"
         )
 
-    field_set = set(fields)
-    field_set.add(field)
-    return _functools.partial(  # type: ignore
-        CallOnceDrawnFunctionDescriptor, field_set
-    )
+    frozen_fields = _intern_fields(field, *fields)
+
+    def decorator(func: _T) -> _T:
+        return CallOnceDrawnFunctionDescriptor(  # type: ignore [return-value]
+            frozen_fields, func  # type: ignore [arg-type]
+        )
+
+    return decorator
@@ -1,7 +1,6 @@
 """This module contains the `dataclass` decorator."""
 
 import dataclasses as _dataclasses
-import functools as _functools
 import sys as _sys
 
 from typing import Callable as _Callable, Optional as _Optional, \
@@ -128,28 +127,23 @@ def dataclass(
     if weakref_slot is None:
         weakref_slot = False
 
-    base = _functools.partial(
-        _dataclasses.dataclass,
+    kwargs = dict(
         repr=repr, eq=eq, order=order, unsafe_hash=unsafe_hash,
         frozen=frozen
     )
 
     if _sys.version_info >= (3, 10):
-        base = _functools.partial(
-            base, match_args=match_args, kw_only=kw_only, slots=slots
-        )
+        kwargs.update(match_args=match_args, kw_only=kw_only, slots=slots)
 
     if _sys.version_info >= (3, 11):
-        base = _functools.partial(
-            base, weakref_slot=weakref_slot
-        )
+        kwargs.update(weakref_slot=weakref_slot)
 
     def setup(t: _Type):
         # It is important to cache the return value of the call and
         # never cls itself since a new type might be constructed, for
         # example when slots is True.
-        dc = base(t)
-        if not isinstance(dc, type):
+        dc = _dataclasses.dataclass(t, **kwargs)  # type: ignore
+        if __debug__ and (not isinstance(dc, type)):
             # Failsafe in case a function is returned instead of a type.
             # This would hint at incorrect use of the decorator.
             raise AssertionError(
@@ -1,17 +1,21 @@
 """This module contains the `instances` strategy function."""
 
 import dataclasses as _dataclasses
-import functools as _functools
 import hypothesis as _hypothesis
 import hypothesis.strategies as _st
+import operator as _operator
+import sys as _sys
+import typing as _typing
 
 from dataclasses import dataclass as _dataclass, Field as _Field
 from hypothesis.strategies import composite as _composite, \
     DrawFn as _DrawFn, SearchStrategy as _SearchStrategy
-from typing import Callable as _Callable, Dict as _Dict, \
-    Iterable as _Iterable, List as _List, Mapping as _Mapping, \
-    Optional as _Optional, Sequence as _Sequence, Tuple as _Tuple, \
-    Type as _Type, TypeVar as _TypeVar
+from types import MappingProxyType as _MappingProxyType
+from typing import Callable as _Callable, Collection as _Collection, \
+    Dict as _Dict, FrozenSet as _FrozenSet, List as _List, \
+    Mapping as _Mapping, NoReturn as _NoReturn, Optional as _Optional, \
+    Sequence as _Sequence, Set as _Set, Tuple as _Tuple, Type as _Type, \
+    TypeVar as _TypeVar
 
 try:
     from pydantic import ValidationError as _ValidationError
@@ -53,7 +57,8 @@ def drawn_fields(cls: _Type[_T]) -> _Sequence[str]:
 
     Args:
         cls (type[T]): The dataclass for which to compute the drawn
-            fields.
+            fields. Like for `dataclasses.fields`, an instance of the
+            dataclass is also accepted.
 
     Raises:
         TypeError: If `cls` is not a dataclass.
@@ -65,9 +70,110 @@ def drawn_fields(cls: _Type[_T]) -> _Sequence[str]:
     """
     if not _dataclasses.is_dataclass(cls):
         raise TypeError("'cls' was not a dataclass.")
-    return tuple(
-        f.name for f in _dataclasses.fields(cls) if will_draw(f)
-    )
+    if not isinstance(cls, type):
+        # The results are cached on the class, not the instance.
+        cls = type(cls)
+    return _drawn_fields_cached(cls)
+
+
+_CLASS_CACHE_ATTR = "__hypothesis_dataclasses_cache__"
+"""The name of the class attribute holding the values cached for the
+class."""
+
+
+def _class_cache(cls: _Type) -> _Dict[str, object]:
+    """Get the dict used to cache values computed for a class. The dict
+    is stored on the class itself, so that it shares the lifetime of the
+    class. Storing it in a global mapping instead would keep the class
+    alive if any of the cached values references the class.
+
+    Args:
+        cls (type): The class for which to obtain the cache.
+
+    Returns:
+        dict[str, object]: The cache of the class. The cache is not
+            inherited by subclasses.
+    """
+    try:
+        return cls.__dict__[_CLASS_CACHE_ATTR]
+    except KeyError:
+        pass
+    cache: _Dict[str, object] = dict()
+    try:
+        setattr(cls, _CLASS_CACHE_ATTR, cache)
+    except (AttributeError, TypeError):
+        # The class does not permit setting attributes. The values will
+        # be recomputed on each call.
+        pass
+    return cache
+
+
+def _fields_cached(cls: _Type) -> _Tuple[_Field, ...]:
+    """Like `dataclasses.fields`, but the result is cached per class.
+    Since the result is cached, changes to the fields of a dataclass
+    after the first call are not reflected. This is only possible by
+    modifying the dataclass internals after the class was created.
+
+    Args:
+        cls (type): The dataclass for which to obtain the fields.
+
+    Returns:
+        tuple[Field, ...]: The (cached) fields of the dataclass.
+    """
+    cache = _class_cache(cls)
+    try:
+        return cache["fields"]  # type: ignore [return-value]
+    except KeyError:
+        pass
+    fields = _dataclasses.fields(cls)
+    cache["fields"] = fields
+    return fields
+
+
+def _drawn_fields_cached(cls: _Type) -> _Sequence[str]:
+    """Computes the result of `drawn_fields` without checking whether
+    `cls` is a dataclass. The result is cached per class. See also
+    `_fields_cached`.
+
+    Args:
+        cls (type): The dataclass for which to compute the drawn
+            fields.
+
+    Returns:
+        Sequence[str]: The (cached) names of the fields that will be
+            drawn.
+    """
+    cache = _class_cache(cls)
+    try:
+        return cache["drawn_fields"]  # type: ignore [return-value]
+    except KeyError:
+        pass
+    result = tuple(f.name for f in _fields_cached(cls) if will_draw(f))
+    cache["drawn_fields"] = result
+    return result
+
+
+def _get_type_hints(cls: _Type) -> _Dict[str, object]:
+    """Resolve the type hints of a class. Where supported, `Annotated`
+    metadata is retained.
+
+    Args:
+        cls (type): The class for which to resolve the type hints.
+
+    Returns:
+        dict[str, object]: The resolved type hints. This is empty if the
+            type hints cannot be resolved, for example because they
+            refer to names not available in the module of the class or
+            because evaluating them raises an exception, like `int | None`
+            before Python 3.10. The unresolved annotations are then used
+            as they are.
+    """
+    try:
+        if _sys.version_info >= (3, 9):
+            return _typing.get_type_hints(cls, include_extras=True)
+        return _typing.get_type_hints(cls)
+    except Exception:
+        return dict()
 
 
 def _get_strategy_map(
@@ -85,6 +191,28 @@ def _get_strategy_map(
             be drawn.
     """
 
+    hints: _Optional[_Dict[str, object]] = None
+
+    def resolve_type(f: _Field) -> object:
+        """Resolve the type annotation of a field, which may be a string
+        if the evaluation of annotations is postponed.
+
+        Args:
+            f (Field): The dataclass field to process.
+
+        Returns:
+            object: The type of the field.
+        """
+        nonlocal hints
+        t = f.type
+        if not isinstance(t, str):
+            return t
+        if hints is None:
+            # Resolving the hints is expensive, so it is only done once
+            # and only if necessary.
+            hints = _get_type_hints(cls)
+        return hints.get(f.name, t)
+
     def get_item(f: _Field) -> _Tuple[str, _SearchStrategy]:
         """Construct an item for the return value of the surrounding
         function.
@@ -96,9 +224,8 @@ def _get_strategy_map(
             tuple[str, SearchStrategy]: A pair of a field name and its
                 corresponding `SearchStrategy`
         """
-        md = f.metadata
-        if (md is not None) and (_field_from.STRATEGY_METADATA_KEY in md):
-            res = md[_field_from.STRATEGY_METADATA_KEY]
+        res = f.metadata.get(_field_from.STRATEGY_METADATA_KEY)
+        if res is not None:
             if not isinstance(res, _SearchStrategy):
                 # Failsafe, the key should always lead to a strategy.
                 raise AssertionError(
@@ -111,19 +238,43 @@ def _get_strategy_map(
             if default is not _dataclasses.MISSING:
                 st = _st.just(default)
             else:
-                st = _st.from_type(f.type)
+                st = _st.from_type(resolve_type(f))
         return f.name, st
 
-    all_fields = _dataclasses.fields(cls)  # type: ignore [arg-type]
-    init_fields = filter(lambda f: f.init, all_fields)
-    return tuple(map(get_item, init_fields))
+    return tuple(get_item(f) for f in _fields_cached(cls) if f.init)
 
 
-_CallOnceDrawnFunctionFieldsSet = _Callable[
-    [_partial_instance.PartialInstance],
-    None
+_StrategyMap = _Sequence[_Tuple[str, _SearchStrategy]]
+"""The pairs of field names and strategies returned by
+`_get_strategy_map`."""
+
+
+def _get_strategy_map_cached(cls: _Type[_T]) -> _StrategyMap:
+    """Like `_get_strategy_map`, but the result is cached per class.
+
+    Args:
+        cls (type): The class for which to obtain the mapping.
+
+    Returns:
+        Sequence[tuple[str, SearchStrategy]]: The (cached) result of
+            `_get_strategy_map`.
+    """
+    cache = _class_cache(cls)
+    try:
+        return cache["strategy_map"]  # type: ignore [return-value]
+    except KeyError:
+        pass
+    smap = _get_strategy_map(cls)
+    cache["strategy_map"] = smap
+    return smap
+
+
+_CallOnceDrawnCallback = _Tuple[
+    _Callable[[_FrozenSet[str], _partial_instance.PartialInstance], None],
+    _FrozenSet[str]
 ]
-"""A function used as a calloncedrawn-callback with the fields set."""
+"""A function used as a calloncedrawn-callback together with the fields
+to pass as its first argument."""
 
 
 _ManualDrawMapping = _Mapping[str, _ManualDrawFunction]
@@ -131,12 +282,34 @@ _ManualDrawMapping = _Mapping[str, _ManualDrawFunction]
 
 
 _CallOnceDrawnMapping = _Mapping[
-    str, _Sequence[_CallOnceDrawnFunctionFieldsSet]
+    str, _Sequence[_CallOnceDrawnCallback]
 ]
 """A dict mapping field names to callbacks to call after the field has
 been drawn."""
 
 
+_DrawStep = _Tuple[
+    str,
+    _SearchStrategy,
+    _Optional[_ManualDrawFunction],
+    _Optional[_Sequence[_CallOnceDrawnCallback]]
+]
+"""The steps performed to draw a single field: The field name, the
+strategy, the manual draw function (if any) and the callbacks to call
+after the field has been drawn (if any)."""
+
+
+_EMPTY_MAPPING: _Mapping = _MappingProxyType(dict())
+"""An empty mapping shared by all classes without callbacks."""
+
+
+_DESCRIPTOR_TYPES = (
+    _ManualDrawFunctionDescriptor,
+    _CallOnceDrawnFunctionDescriptor
+)
+"""The types of the descriptors processed by `_Callbacks.get`."""
+
+
 @_dataclass
 class _Callbacks:
     """Bundles the callbacks for a class."""
@@ -150,22 +323,6 @@ class _Callbacks:
     """The dict mapping field names to a sequence of callbacks to call
     after the field has been drawn."""
 
-    @staticmethod
-    def _mro_resolved_dict(cls: _Type[_T]) -> _Dict[str, object]:
-        """Compute the MRO resolved dictionary of a class object.
-
-        Args:
-            cls (type[T]): The type for which to compute the dict.
-
-        Returns:
-            dict[str, object]: A dict containing the MRO-resolved
-                members of `cls`.
-        """
-        result: _Dict[str, object] = dict()
-        for t in reversed(cls.mro()):
-            result.update(t.__dict__)
-        return result
-
     @classmethod
     def get(cls, t: _Type[_T]):
         """Obtain the callbacks for a dataclass.
@@ -175,55 +332,95 @@ class _Callbacks:
 
         Raises:
             ValueError: If a field is referenced by multiple
-                `manualdraw` decorators.
+                `manualdraw` decorators or if a field required by a
+                `manualdraw` decorator is not drawn before the fields
+                it draws.
+            AttributeError: If a `calloncedrawn` decorator depends on
+                a field that is not drawn or if a field required by a
+                `manualdraw` decorator is not an init field.
 
         Returns:
             _Callbacks: The instance containing the callbacks.
         """
 
+        draw_fields = _drawn_fields_cached(t)
+        # We need to determine the position at which each field is drawn
+        field_idx_map = {k: i for i, k in enumerate(draw_fields)}
+
+        # The fields with default values are also passed to the
+        # constructor and are available in the `PartialInstance`, so
+        # the `requires` check uses the order of all init fields.
+        init_fields = tuple(f.name for f in _fields_cached(t) if f.init)
+        init_idx_map = {k: i for i, k in enumerate(init_fields)}
+
+        def init_idx(field: str) -> int:
+            """Get the position at which a field is passed to the
+            `PartialInstance`s and the constructor.
+
+            Args:
+                field (str): The name of the field.
+
+            Raises:
+                AttributeError: If `field` is not an init field.
+
+            Returns:
+                int: The index of the field in the init fields.
+            """
+            try:
+                return init_idx_map[field]
+            except KeyError as ke:
+                raise AttributeError(
+                    f"Not a valid (init) field of {t.__qualname__!r}."
+                ) from ke
+
         draw_manually: _Dict[str, _ManualDrawFunction] = dict()
 
-        def handle_manualdraw(k: str, v: object):
+        def handle_manualdraw(v: _ManualDrawFunctionDescriptor):
             """Handle a `ManualDrawFunctionDescriptor`.
 
             Args:
-                k (str): The field name.
-                v (object): The object to handle. If it is a
-                    `ManualDrawFunctionDescriptor` instance, the
-                    callback will be processed and added to
+                v (ManualDrawFunctionDescriptor): The descriptor to
+                    handle. The callback will be processed and added to
                     `draw_manually`.
 
             Raises:
                 ValueError: If a field is referenced by multiple
-                    `manualdraw` decorators.
+                    `manualdraw` decorators or if a required field is
+                    not drawn before the fields drawn by `v`.
+                AttributeError: If a required field is not an init
+                    field.
             """
-            if not isinstance(v, _ManualDrawFunctionDescriptor):
-                return
+            if v.requires:
+                first = min(
+                    (init_idx_map[f] for f in v.fields if f in init_idx_map),
+                    default=len(init_fields)
+                )
+                for field in v.requires:
+                    if init_idx(field) >= first:
+                        raise ValueError(
+                            f"The field {field!r} required by a "
+                            "@manualdraw decorator is not drawn before "
+                            "the fields it draws."
+                        )
             for field in v.fields:
                 if field in draw_manually:
                     raise ValueError(
                         f"The field {field!r} is referenced by multiple "
                         "@manualdraw decorators."
                     )
-                # Use getattr to trigger the descriptor (classmethod or
-                # staticmethod)
-                draw_manually[field] = getattr(t, k)
+                draw_manually[field] = v.resolve(t)
 
         drawn_callbacks: _Dict[
-            str, _List[_CallOnceDrawnFunctionFieldsSet]
+            str, _List[_CallOnceDrawnCallback]
         ] = dict()
 
-        draw_fields = drawn_fields(t)
-        # We need to determine the position at which each field is drawn
-        field_idx_map = {k: i for i, k in enumerate(draw_fields)}
-
-        def call_after(fields: _Iterable[str]) -> str:
+        def call_after(fields: _Collection[str]) -> str:
             """Get the name of the last drawn field after which the
             callback waiting for `fields` can be called.
 
             Args:
-                fields (Iterable[str]): The fields the callback depends
-                    on.
+                fields (Collection[str]): The fields the callback
+                    depends on. Must not be empty.
 
             Returns:
                 str: The name of the last field that must have been
@@ -231,24 +428,25 @@ class _Callbacks:
                     depending on `fields` can be called.
             """
             try:
-                return draw_fields[max(field_idx_map[f] for f in fields)]
+                indices = _operator.itemgetter(*fields)(field_idx_map)
             except KeyError as ke:
                 raise AttributeError(
                     f"Not a valid (drawn) field of {t.__qualname__!r}."
                 ) from ke
+            # itemgetter returns a single value instead of a tuple if
+            # only one item is requested.
+            if len(fields) > 1:
+                indices = max(indices)
+            return draw_fields[indices]
 
-        def handle_calloncedrawn(k: str, v: object):
+        def handle_calloncedrawn(v: _CallOnceDrawnFunctionDescriptor):
             """Handle a `CallOnceDrawnFunctionDescriptor`.
 
             Args:
-                k (str): The field name.
-                v (object): The object to handle. If it is a
-                    `CallOnceDrawnFunctionDescriptor` instance, the
-                    callback will be processed and added to
+                v (CallOnceDrawnFunctionDescriptor): The descriptor to
+                    handle. The callback will be processed and added to
                     `drawn_callbacks`.
             """
-            if not isinstance(v, _CallOnceDrawnFunctionDescriptor):
-                return
             call_after_field = call_after(v.fields)
 
             try:
@@ -257,20 +455,264 @@ class _Callbacks:
                 lst = list()
                 drawn_callbacks[call_after_field] = lst
 
-            # Use getattr to trigger the descriptor
-            func = getattr(t, k)
-            # Apply the fields to the function call
-            func_f_set = _functools.partial(func, v.fields)
-            lst.append(func_f_set)
+            # The fields are passed to the function call directly
+            lst.append((v.resolve(t), v.fields))
+
+        # Scan the MRO once, only keeping the descriptors. Names already
+        # seen in a more derived class hide the members of the base
+        # classes, even if they are not descriptors.
+        seen: _Set[str] = set()
+        mro_descriptors: _List[_List[object]] = list()
+        for t_ in t.mro():
+            descriptors: _List[object] = list()
+            for k, v in t_.__dict__.items():
+                if k in seen:
+                    continue
+                seen.add(k)
+                if isinstance(v, _DESCRIPTOR_TYPES):
+                    descriptors.append(v)
+            mro_descriptors.append(descriptors)
+
+        # Handle the base classes first so that the callbacks of a field
+        # are called in the order of their definition.
+        for descriptors in reversed(mro_descriptors):
+            for v in descriptors:
+                if isinstance(v, _ManualDrawFunctionDescriptor):
+                    handle_manualdraw(v)
+                elif isinstance(v, _CallOnceDrawnFunctionDescriptor):
+                    handle_calloncedrawn(v)
+                else:
+                    # Failsafe, only descriptors are collected above.
+                    raise AssertionError(f"Unexpected object {v!r}.")
+
+        if not draw_manually:
+            draw_manually = _EMPTY_MAPPING  # type: ignore [assignment]
+        if drawn_callbacks:
+            frozen_drawn_callbacks: _CallOnceDrawnMapping = {
+                k: tuple(v) for k, v in drawn_callbacks.items()
+            }
+        else:
+            frozen_drawn_callbacks = _EMPTY_MAPPING
+        return cls(draw_manually, frozen_drawn_callbacks)
 
-        for k, v in cls._mro_resolved_dict(t).items():
-            handle_manualdraw(k, v)
-            handle_calloncedrawn(k, v)
+    @classmethod
+    def get_cached(cls, t: _Type[_T]):
+        """Like `get`, but the result is cached per class. Since the
+        callbacks are determined during class creation, they cannot
+        change afterwards.
 
-        frozen_drawn_callbacks = {
-            k: tuple(v) for k, v in drawn_callbacks.items()
-        }
-        return cls(draw_manually, frozen_drawn_callbacks)
+        Args:
+            t (type[T]): The type for which to obtain the callbacks.
+
+        Raises:
+            ValueError: If a field is referenced by multiple
+                `manualdraw` decorators or if a field required by a
+                `manualdraw` decorator is not drawn before the fields
+                it draws.
+            AttributeError: If a `calloncedrawn` decorator depends on
+                a field that is not drawn or if a field required by a
+                `manualdraw` decorator is not an init field.
+
+        Returns:
+            _Callbacks: The (cached) instance containing the callbacks.
+        """
+        cache = _class_cache(t)
+        try:
+            return cache["callbacks"]  # type: ignore [return-value]
+        except KeyError:
+            pass
+        callbacks = cls.get(t)
+        cache["callbacks"] = callbacks
+        return callbacks
+
+
+def _compile_draw_fn(
+    cls: _Type[_T],
+    plan: _Sequence[_DrawStep],
+    reject_invalid: bool
+) -> _Callable[[_DrawFn], _T]:
+    """Generate a function drawing an instance of a dataclass according
+    to a draw plan. The loop over the fields is unrolled and the
+    generated function calls the manual draw functions and callbacks of
+    each field directly before constructing the instance. For example,
+    for fields `i` (drawn from a strategy and followed by a callback)
+    and `j` (drawn manually), the generated function is:
+
+        def draw_instance(_draw, *, _cls=_cls, _PI=_PI, _s0=_s0, ...):
+            _v0 = _draw(_s0)
+            _c0_0(_f0_0, _PI(i=_v0))
+            _v1 = _m1(_draw, 'j', _PI(i=_v0))
+            return _cls(i=_v0, j=_v1)
+
+    Args:
+        cls (type[T]): The dataclass.
+        plan (Sequence[_DrawStep]): The steps for each field passed to
+            `__init__` in the order in which they should be drawn.
+        reject_invalid (bool): Whether to convert pydantic
+            `ValidationError`s raised when constructing the instance to
+            failed hypothesis assumptions.
+
+    Returns:
+        Callable[[DrawFn], T]: The function drawing an instance.
+    """
+    namespace: _Dict[str, object] = {
+        "_cls": cls,
+        "_PI": _partial_instance.PartialInstance
+    }
+    lines: _List[str] = list()
+    drawn: _List[_Tuple[str, str]] = list()
+
+    def partial_instance() -> str:
+        """Generate the expression constructing a `PartialInstance`
+        from the fields drawn so far.
+
+        Returns:
+            str: The expression.
+        """
+        # Each callback receives its own `PartialInstance`, since it may
+        # be modified accidentally. Passing the values as literal
+        # keyword arguments avoids building an intermediate dict.
+        items = ", ".join(f"{name}={var}" for name, var in drawn)
+        return f"_PI({items})"
+
+    for i, (name, strat, manual_draw_fn, callbacks) in enumerate(plan):
+        var = f"_v{i}"
+        if manual_draw_fn is None:
+            namespace[f"_s{i}"] = strat
+            lines.append(f"    {var} = _draw(_s{i})")
+        else:
+            namespace[f"_m{i}"] = manual_draw_fn
+            lines.append(
+                f"    {var} = _m{i}(_draw, {name!r}, {partial_instance()})"
+            )
+        drawn.append((name, var))
+        if callbacks is not None:
+            for j, (callback, fields) in enumerate(callbacks):
+                namespace[f"_c{i}_{j}"] = callback
+                namespace[f"_f{i}_{j}"] = fields
+                lines.append(
+                    f"    _c{i}_{j}(_f{i}_{j}, {partial_instance()})"
+                )
+
+    kwargs = ", ".join(f"{name}={var}" for name, var in drawn)
+    if reject_invalid:
+        namespace["_ValidationError"] = _ValidationError
+        namespace["_reject"] = _reject
+        lines.append("    try:")
+        lines.append(f"        return _cls({kwargs})")
+        lines.append("    except _ValidationError:")
+        lines.append("        _reject()")
+    else:
+        lines.append(f"    return _cls({kwargs})")
+
+    # The objects used by the function are bound as keyword-only
+    # default arguments, so that they are accessed as local variables.
+    bound = ", ".join(f"{name}={name}" for name in namespace)
+    lines.insert(0, f"def draw_instance(_draw, *, {bound}):")
+    source = "\n".join(lines)
+    filename = f"<hypothesis_dataclasses draw {cls.__qualname__}>"
+    exec(compile(source, filename, "exec"), namespace)
+    return namespace["draw_instance"]  # type: ignore [return-value]
+
+
+def _get_draw_fn_cached(
+    cls: _Type[_T],
+    reject_invalid: bool
+) -> _Callable[[_DrawFn], _T]:
+    """Obtain the function drawing an instance of a dataclass generated
+    by `_compile_draw_fn`. The result is cached per class.
+
+    Args:
+        cls (type[T]): The dataclass.
+        reject_invalid (bool): Whether to convert pydantic
+            `ValidationError`s to failed hypothesis assumptions.
+
+    Raises:
+        ValueError: If a field is referenced by multiple `manualdraw`
+            decorators or if a field required by a `manualdraw`
+            decorator is not drawn before the fields it draws.
+        AttributeError: If a `calloncedrawn` decorator depends on a
+            field that is not drawn or if a field required by a
+            `manualdraw` decorator is not an init field.
+
+    Returns:
+        Callable[[DrawFn], T]: The (cached) function drawing an
+            instance.
+    """
+    key = "draw_fn_reject_invalid" if reject_invalid else "draw_fn"
+    cache = _class_cache(cls)
+    try:
+        return cache[key]  # type: ignore [return-value]
+    except KeyError:
+        pass
+
+    smap = _get_strategy_map_cached(cls)
+    callbacks = _Callbacks.get_cached(cls)
+    man_draws = callbacks.manualdraw
+    callback_map = callbacks.calloncedrawn
+
+    # Resolve the manual draw functions and callbacks of each field
+    # once, so that no lookups are required for each drawn example.
+    plan: _Sequence[_DrawStep] = tuple(
+        (name, strat, man_draws.get(name), callback_map.get(name))
+        for name, strat in smap
+    )
+
+    draw_fn = _compile_draw_fn(cls, plan, reject_invalid)
+    cache[key] = draw_fn
+    return draw_fn
+
+
+def _reject_validation_errors(
+    func: _Callable[..., _T]
+) -> _Callable[..., _T]:
+    """Wrap a function so that pydantic `ValidationError`s raised by it
+    are converted to failed hypothesis assumptions.
+
+    Args:
+        func (Callable[..., T]): The function to wrap.
+
+    Returns:
+        Callable[..., T]: The wrapped function.
+    """
+
+    def wrapper(*args, **kwargs) -> _T:
+        """Call `func`, rejecting the example on a `ValidationError`.
+
+        Returns:
+            T: The return value of `func`.
+        """
+        try:
+            return func(*args, **kwargs)
+        except _ValidationError:
+            _reject()
+
+    return wrapper
+
+
+def _reject() -> _NoReturn:
+    """Reject the current example by failing a hypothesis assumption."""
+    _hypothesis.assume(False)
+    # Failsafe in case assume does something unexpected.
+    raise AssertionError(
+        "'hypothesis.assume(False)' did not raise an exception."
+    )
+
+
+def _may_raise_validation_error(cls: _Type) -> bool:
+    """Checks whether constructing instances of a class may raise a
+    pydantic `ValidationError`, which is the case for pydantic
+    dataclasses.
+
+    Args:
+        cls (type): The class to check.
+
+    Returns:
+        bool: Whether `cls` is a pydantic dataclass.
+    """
+    # pydantic v2 dataclasses have a validator, v1 dataclasses a model.
+    return hasattr(cls, "__pydantic_validator__") \
+        or hasattr(cls, "__pydantic_model__")
 
 
 def _is_dataclass(cls: _Type) -> bool:
@@ -287,6 +729,76 @@ def _is_dataclass(cls: _Type) -> bool:
     return _dataclasses.is_dataclass(cls)
 
 
+def _build_strategy(
+    cls: _Type[_T],
+    reject_invalid: bool
+) -> _SearchStrategy[_T]:
+    """Construct the strategy returned (in deferred form) by
+    `instances`.
+
+    Args:
+        cls (type[T]): The dataclass.
+        reject_invalid (bool): Whether to convert pydantic
+            `ValidationError`s to failed hypothesis assumptions.
+
+    Raises:
+        ValueError: If a field is referenced by multiple `manualdraw`
+            decorators or if a field required by a `manualdraw`
+            decorator is not drawn before the fields it draws.
+        AttributeError: If a `calloncedrawn` decorator depends on a
+            field that is not drawn or if a field required by a
+            `manualdraw` decorator is not an init field.
+
+    Returns:
+        SearchStrategy[T]: The search strategy.
+    """
+    callbacks = _Callbacks.get_cached(cls)
+    if (not callbacks.manualdraw) and (not callbacks.calloncedrawn):
+        # Without callbacks, the fields can be drawn independently.
+        kwargs = dict(_get_strategy_map_cached(cls))
+        target: _Callable[..., _T] = cls
+        if reject_invalid:
+            target = _reject_validation_errors(target)
+        return _st.builds(target, **kwargs)
+
+    return _composite(_get_draw_fn_cached(cls, reject_invalid))()
+
+
+def _get_strategy_definition(
+    cls: _Type[_T],
+    reject_invalid: bool
+) -> _Callable[[], _SearchStrategy[_T]]:
+    """Get a function constructing the strategy for a dataclass using
+    `_build_strategy`. The function is cached per class, so that
+    hypothesis can reuse the deferred strategy it is passed to.
+
+    Args:
+        cls (type[T]): The dataclass.
+        reject_invalid (bool): Whether to convert pydantic
+            `ValidationError`s to failed hypothesis assumptions.
+
+    Returns:
+        Callable[[], SearchStrategy[T]]: The (cached) function.
+    """
+    key = "definition_reject_invalid" if reject_invalid else "definition"
+    cache = _class_cache(cls)
+    try:
+        return cache[key]  # type: ignore [return-value]
+    except KeyError:
+        pass
+
+    def definition() -> _SearchStrategy[_T]:
+        """Build the strategy for `cls`.
+
+        Returns:
+            SearchStrategy[T]: The strategy.
+        """
+        return _build_strategy(cls, reject_invalid)
+
+    cache[key] = definition
+    return definition
+
+
 def instances(
     cls: _Type[_T],
     *,
@@ -306,7 +818,9 @@ def instances(
         TypeError: If `cls` is not a dataclass.
         ValueError: If no search strategy can be found for a field of
             the dataclass because no strategy is specified and no type
-            annotation is given.
+            annotation is given. Like other errors concerning the
+            fields and callbacks of the dataclass, this is only raised
+            once the strategy is first used.
 
     Returns:
         SearchStrategy[T]: The search strategy.
@@ -343,74 +857,8 @@ def instances(
     if not _is_dataclass(cls):
         raise TypeError("'cls' was not a dataclass.")
 
-    smap = _get_strategy_map(cls)
-    callbacks = _Callbacks.get(cls)
-    man_draws = callbacks.manualdraw
-    callback_map = callbacks.calloncedrawn
-
-    def draw_instance(draw: _DrawFn) -> _Dict[str, object]:
-        """Construct a dictionary for the fields of the instance and
-        call the callbacks if appropriate.
-
-        Args:
-            draw (DrawFn): The hypothesis draw function.
-
-        Returns:
-            dict[str, object]: The dictionary containing the values for
-                the dataclass fields (the keys).
-        """
-
-        instance_dict: _Dict[str, object] = dict()
-
-        for field_name, strat in smap:
-            try:
-                manual_draw_fn = man_draws[field_name]
-            except KeyError:
-                value = draw(strat)
-            else:
-                pi = _partial_instance.PartialInstance(**instance_dict)
-                value = manual_draw_fn(draw, field_name, pi)
-
-            instance_dict[field_name] = value
-
-            try:
-                callbacks = callback_map[field_name]
-            except KeyError:
-                pass
-            else:
-                for callback in callbacks:
-                    # Create a new instance for each call, since it may
-                    # be modified accidentally.
-                    pi = _partial_instance.PartialInstance(**instance_dict)
-                    # The callbacks already have the first argument
-                    # (the fields) set.
-                    callback(pi)
-
-        return instance_dict
-
-    # We define helper functions to generate the strategy. These
-    # functions capture all necessary info from this function as their
-    # closure.
-    if (not _PYDANTIC_AVAILABLE) or disable_pydantic:
-
-        @_composite
-        def strategy(draw: _DrawFn) -> _T:
-            vmap = draw_instance(draw)
-            return cls(**vmap)
-
-    else:
-
-        @_composite
-        def strategy(draw: _DrawFn) -> _T:
-            vmap = draw_instance(draw)
-            try:
-                return cls(**vmap)
-            except _ValidationError:
-                _hypothesis.assume(False)
-                # Failsafe in case assume does something unexpected.
-                raise AssertionError(
-                    "'hypothesis.assume(False)' did not raise an "
-                    "exception."
-                )
-
-    return strategy()
+    reject_invalid = _PYDANTIC_AVAILABLE and (not disable_pydantic) \
+        and _may_raise_validation_error(cls)
+    # The strategy is only constructed once it is used, since resolving
+    # the fields and callbacks is unnecessary if nothing is ever drawn.
+    return _st.deferred(_get_strategy_definition(cls, reject_invalid))
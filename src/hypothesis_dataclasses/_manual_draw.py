@@ -1,14 +1,13 @@
 """This module implements the `manualdraw` decorator."""
 
-import functools as _functools
-
 from hypothesis.strategies import DrawFn as _DrawFn
 from typing import Any as _Any, Callable as _Callable, \
-    ClassVar as _ClassVar, FrozenSet as _FrozenSet, Set as _Set, \
-    TypeVar as _TypeVar
+    ClassVar as _ClassVar, FrozenSet as _FrozenSet, \
+    Iterable as _Iterable, TypeVar as _TypeVar
 
 from ._partial_instance import PartialInstance as _PartialInstance
-from ._scfunc_descriptor import SCFuncDescriptor as _SCFuncDescriptor
+from ._scfunc_descriptor import intern_fields as _intern_fields, \
+    SCFuncDescriptor as _SCFuncDescriptor
 
 
 _T = _TypeVar("_T")
@@ -21,19 +20,28 @@ ManualDrawFunction = _Callable[[_DrawFn, str, _PartialInstance], _Any]
 class ManualDrawFunctionDescriptor(_SCFuncDescriptor):
     """A descriptor marking a function for a manual draw."""
 
-    __slots__ = ("fields",)
+    __slots__ = ("fields", "requires")
 
-    def __init__(self, fields: _Set[str], func: _Callable):
+    def __init__(
+        self,
+        fields: _FrozenSet[str],
+        func: _Callable,
+        requires: _FrozenSet[str] = frozenset()
+    ):
         """Construct a new `ManualDrawFunctionDescriptor`.
 
         Args:
-            fields (Set[str]): The fields for which to call the
+            fields (FrozenSet[str]): The fields for which to call the
                 function to draw the fields' values.
             func (Callable): The function to call. Must be wrapped in
                 @staticmethod or @classmethod.
+            requires (FrozenSet[str], optional): The fields that must
+                have been drawn before the function is called. Defaults
+                to an empty set.
         """
         super().__init__(func)
-        self.fields: _FrozenSet[str] = frozenset(fields)
+        self.fields: _FrozenSet[str] = fields
+        self.requires: _FrozenSet[str] = requires
 
     _nparam_classmethod: _ClassVar[int] = 4
     """The number of expected parameters if the descriptor is applied to
@@ -44,7 +52,9 @@ class ManualDrawFunctionDescriptor(_SCFuncDescriptor):
     a staticmethod."""
 
 
-def manualdraw(field: str, *fields: str) -> _Callable[[_T], _T]:
+def manualdraw(
+    field: str, *fields: str, requires: _Iterable[str] = ()
+) -> _Callable[[_T], _T]:
     """A decorator for functions that perform manual draws for fields.
     The function should have the signature
     `f(DrawFn, str, PartialInstance)` and must be a staticmethod or
@@ -57,17 +67,26 @@ def manualdraw(field: str, *fields: str) -> _Callable[[_T], _T]:
     fields, where the value of one field might depend on several
     previously drawn fields. Additionally, it is also possible to use
     these functions to reject the example using `hypothesis.assume`.
+    The fields the function depends on can be declared via `requires`.
+    They are checked once when the strategy for the dataclass is first
+    used instead of on every draw.
 
     Args:
         field(s) (str): The field(s) for which to perform the draw.
             Duplicates will be removed.
+        requires (Iterable[str], optional): The fields that must be
+            available in the `PartialInstance` passed to the function.
+            If any of them is not drawn before all of the fields in
+            `field(s)`, an exception is raised once the strategy
+            returned by `instances` is first used. Defaults to no
+            fields.
 
     Raises:
         RuntimeError: If no fields are provided and this function is
             applied directly to the function to decorate without
             parentheses.
         TypeError: If the decorated function is not a static or class
-            function.
+            function or if `requires` is a str.
 
     Examples:
         >>> from dataclasses import dataclass
@@ -126,8 +145,18 @@ def manualdraw(field: str, *fields: str) -> _Callable[[_T], _T]:
             "field name?"
         )
 
-    field_set = set(fields)
-    field_set.add(field)
-    return _functools.partial(  # type: ignore
-        ManualDrawFunctionDescriptor, field_set
-    )
+    if isinstance(requires, str):
+        raise TypeError(
+            "'requires' was a str. It must be a collection of field "
+            "names."
+        )
+
+    frozen_fields = _intern_fields(field, *fields)
+    frozen_requires = frozenset(requires)
+
+    def decorator(func: _T) -> _T:
+        return ManualDrawFunctionDescriptor(  # type: ignore [return-value]
+            frozen_fields, func, frozen_requires  # type: ignore [arg-type]
+        )
+
+    return decorator
@@ -2,10 +2,43 @@
 
 from types import SimpleNamespace as _SimpleNamespace
 
+from typing import Any as _Any, Mapping as _Mapping
+
 
 class PartialInstance(_SimpleNamespace):
     """A partially drawn instance. Fields of the full instance may or
     may not be defined on this class. `hasattr` can for example be used
-    to check for present fields.
+    to check for present fields. Since the fields are stored in the
+    `__dict__` of the instance, `field in vars(pi)` is an equivalent
+    check which avoids raising and catching an `AttributeError` for
+    missing fields.
+
+    Examples:
+        >>> pi = PartialInstance(i=1)
+        >>> "i" in vars(pi)
+        True
+        >>> "j" in vars(pi)
+        False
     """
-    pass
+
+    @classmethod
+    def from_mapping(cls, mapping: _Mapping[str, _Any]) -> "PartialInstance":
+        """Construct a new `PartialInstance` from a mapping of field
+        names to values. This avoids expanding the mapping into keyword
+        arguments. The mapping is copied (shallowly), so adding or
+        removing attributes does not affect `mapping`.
+
+        Args:
+            mapping (Mapping[str, Any]): The field names and values.
+
+        Returns:
+            PartialInstance: The new instance.
+
+        Examples:
+            >>> pi = PartialInstance.from_mapping({"i": 1})
+            >>> pi.i
+            1
+        """
+        self = cls.__new__(cls)
+        self.__dict__.update(mapping)
+        return self
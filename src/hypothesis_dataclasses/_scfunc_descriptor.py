@@ -2,15 +2,75 @@
 `manualdraw` and `calloncedrawn` decorators.
 """
 
-import inspect as _inspect
+from types import FunctionType as _FunctionType
+from typing import Callable as _Callable, ClassVar as _ClassVar, \
+    Dict as _Dict, FrozenSet as _FrozenSet, Optional as _Optional
 
-from typing import Callable as _Callable, ClassVar as _ClassVar
+
+_CO_VARARGS = 0x04
+"""The code object flag marking functions with `*args`."""
+
+_CO_VARKEYWORDS = 0x08
+"""The code object flag marking functions with `**kwargs`."""
+
+
+def _count_parameters(func: _Callable) -> int:
+    """Count the parameters of a function in the same way as
+    `len(inspect.signature(func).parameters)`. For plain functions, the
+    count is read from the code object, which is much cheaper than
+    constructing the signature.
+
+    Args:
+        func (Callable): The function.
+
+    Returns:
+        int: The number of parameters, where `*args` and `**kwargs`
+            count as one parameter each.
+    """
+    if (type(func) is not _FunctionType) or hasattr(func, "__wrapped__") \
+            or hasattr(func, "__signature__"):
+        # Not a plain function (e.g. a bound method, whose code object
+        # includes the bound parameter) or the signature of the wrapped
+        # function or an explicitly set signature should be used.
+        # inspect is only imported if required.
+        import inspect
+        return len(inspect.signature(func).parameters)
+    code = func.__code__
+    flags = code.co_flags
+    return code.co_argcount + code.co_kwonlyargcount \
+        + bool(flags & _CO_VARARGS) + bool(flags & _CO_VARKEYWORDS)
+
+
+_FIELD_SETS: _Dict[_FrozenSet[str], _FrozenSet[str]] = dict()
+"""The interned field sets, see `intern_fields`."""
+
+
+def intern_fields(field: str, *fields: str) -> _FrozenSet[str]:
+    """Obtain the set of field names passed to a decorator. Equal sets
+    are shared between all decorator applications.
+
+    Args:
+        field(s) (str): The field names. Duplicates will be removed.
+
+    Returns:
+        FrozenSet[str]: The (interned) set of field names.
+    """
+    field_set = frozenset((field, *fields))
+    return _FIELD_SETS.setdefault(field_set, field_set)
+
+
+_NPARAM_ATTRS = {
+    classmethod: "_nparam_classmethod",
+    staticmethod: "_nparam_staticmethod",
+}
+"""Maps the supported wrapper types to the name of the attribute
+containing the expected number of parameters."""
 
 
 class SCFuncDescriptor:
     """A descriptor wrapping a staticmethod or classmethod."""
 
-    __slots__ = ("func",)
+    __slots__ = ("func", "_static_func")
 
     _nparam_classmethod: _ClassVar[int] = -1
     """The number of expected parameters if the descriptor is applied to
@@ -21,6 +81,9 @@ class SCFuncDescriptor:
     a staticmethod."""
 
     def __init_subclass__(cls):
+        if not __debug__:
+            # The check only guards against mistakes in this package.
+            return
         for fname in ("_nparam_classmethod", "_nparam_staticmethod"):
             if getattr(cls, fname) != -1:
                 continue
@@ -30,17 +93,19 @@ class SCFuncDescriptor:
             )
 
     def __init__(self, func: _Callable):
-        if isinstance(func, classmethod):
-            exp_nparam = self._nparam_classmethod
-        elif isinstance(func, staticmethod):
-            exp_nparam = self._nparam_staticmethod
-        else:
-            raise TypeError(
-                "The wrapped function was not a staticmethod or a "
-                "classmethod."
-            )
-        sig = _inspect.signature(func.__func__)
-        nparam = len(sig.parameters)
+        attr = _NPARAM_ATTRS.get(type(func))
+        if attr is None:
+            # Subclasses of staticmethod or classmethod
+            for t, attr in _NPARAM_ATTRS.items():
+                if isinstance(func, t):
+                    break
+            else:
+                raise TypeError(
+                    "The wrapped function was not a staticmethod or a "
+                    "classmethod."
+                )
+        exp_nparam: int = getattr(self, attr)
+        nparam = _count_parameters(func.__func__)
         if nparam != exp_nparam:
             raise TypeError(
                 "The wrapped function does not have the expected "
@@ -48,8 +113,30 @@ class SCFuncDescriptor:
                 f"{nparam}."
             )
         self.func: _Callable = func
+        # Accessing a staticmethod always yields the underlying function,
+        # so the descriptor protocol can be skipped. Subclasses might
+        # override __get__ and are therefore excluded.
+        self._static_func: _Optional[_Callable] = \
+            func.__func__ if type(func) is staticmethod else None
+
+    def resolve(self, owner: type) -> _Callable:
+        """Obtain the plain callable wrapped by this descriptor.
+
+        Args:
+            owner (type): The class to bind the function to if it is a
+                classmethod.
+
+        Returns:
+            Callable: The underlying function if the descriptor wraps a
+                staticmethod and the function bound to `owner` if it
+                wraps a classmethod.
+        """
+        return self.__get__(None, owner)
 
     def __get__(self, obj, objtype):
         # We dont want to actually change anything about the function
         # itself.
+        static_func = self._static_func
+        if static_func is not None:
+            return static_func
         return self.func.__get__(obj, objtype)
@@ -0,0 +1,11 @@
+import os
+
+from hypothesis import Phase, settings
+
+
+# Only run the explicit examples attached to the tests. This skips the
+# generation of examples and is meant for quick local runs.
+settings.register_profile("examples_only", phases=[Phase.explicit])
+
+if os.environ.get("FAST_TESTS"):
+    settings.load_profile("examples_only")
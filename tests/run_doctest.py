@@ -7,10 +7,8 @@ import doctest
 from typing import List
 
 
-FLAGS = (
-    doctest.DONT_ACCEPT_TRUE_FOR_1,
-)
-"""Flags used for doctest."""
+OPTIONS = doctest.DONT_ACCEPT_TRUE_FOR_1
+"""The option flags passed to doctest."""
 
 
 def main() -> int:
@@ -18,8 +16,7 @@ def main() -> int:
 
     import hypothesis_dataclasses
 
-    from inspect import getmembers, ismodule
-    from functools import reduce
+    from types import ModuleType
     from warnings import catch_warnings, simplefilter
     from hypothesis.errors import NonInteractiveExampleWarning
 
@@ -28,18 +25,19 @@ def main() -> int:
         # strategies in the doctests which causes this warning.
         simplefilter("ignore", NonInteractiveExampleWarning)
 
-        options = reduce(lambda a, b: a | b, FLAGS)
-
         print("Collecting modules.")
 
-        modules = tuple(getmembers(hypothesis_dataclasses, ismodule))
+        modules = tuple(
+            (name, v) for name, v in vars(hypothesis_dataclasses).items()
+            if isinstance(v, ModuleType)
+        )
         print("Found modules:", ", ".join(map(lambda nm: nm[0], modules)))
 
         overall_fails = 0
         overall_attempts = 0
         failed_modules: List[str] = list()
         for name, m in modules:
-            results = doctest.testmod(m, verbose=True, optionflags=options)
+            results = doctest.testmod(m, verbose=True, optionflags=OPTIONS)
             failed = results.failed
             if failed > 0:
                 failed_modules.append(name)
@@ -0,0 +1,122 @@
+import gc
+import pytest
+import weakref
+
+from hypothesis import given
+from hypothesis.strategies import data, DataObject, DrawFn, integers
+
+from hypothesis_dataclasses import dataclass, field_from, instances, \
+    manualdraw, PartialInstance
+from hypothesis_dataclasses._instances import _class_cache, \
+    _CLASS_CACHE_ATTR, _get_draw_fn_cached
+
+
+@given(data=data())
+def test_repeated_instances_use_cache(data: DataObject):
+    """Test that the strategy map and the callbacks are only computed
+    once per class.
+    """
+
+    @dataclass
+    class A:
+        i: int = field_from(integers())
+
+    data.draw(instances(A))
+    cache = dict(_class_cache(A))
+    assert len(cache) > 0
+    data.draw(instances(A))
+    new_cache = _class_cache(A)
+    assert cache.keys() == new_cache.keys()
+    for k, v in cache.items():
+        assert new_cache[k] is v
+
+
+def test_cache_not_inherited():
+    """Test that subclasses do not use the cache of their base
+    class.
+    """
+
+    @dataclass
+    class A:
+        i: int = field_from(integers())
+
+    @dataclass
+    class B(A):
+        j: int = field_from(integers())
+
+    instances(A)
+    assert _class_cache(B) is not _class_cache(A)
+    assert len(_class_cache(B)) == 0
+
+
+def test_cache_does_not_keep_classes_alive():
+    """Test that the caches do not prevent dynamically created
+    dataclasses from being garbage collected, even if the cached
+    values reference the class.
+    """
+
+    @dataclass
+    class A:
+        i: int
+
+        @manualdraw('i')
+        @classmethod
+        def draw_i(cls, draw: DrawFn, _, __: PartialInstance) -> int:
+            return draw(integers())
+
+    # Only use the internal caches, since hypothesis has its own cache
+    # of strategies.
+    _get_draw_fn_cached(A, False)
+    ref = weakref.ref(A)
+    del A
+    gc.collect()
+    assert ref() is None
+
+
+@given(data=data())
+def test_class_without_attribute_assignment(data: DataObject):
+    """Test that classes which do not permit setting the cache attribute
+    can still be used, even though nothing is cached for them.
+    """
+
+    class Meta(type):
+
+        def __setattr__(cls, name, value):
+            if name == _CLASS_CACHE_ATTR:
+                raise AttributeError(name)
+            super().__setattr__(name, value)
+
+    @dataclass
+    class A(metaclass=Meta):
+        i: int = field_from(integers(0, 5))
+
+    for _ in range(2):
+        x = data.draw(instances(A))
+        assert 0 <= x.i <= 5
+    assert _CLASS_CACHE_ATTR not in A.__dict__
+
+
+def test_instances_is_lazy():
+    """Test that the strategy is only constructed once it is used and
+    that repeated calls return the same strategy.
+    """
+
+    @dataclass
+    class A:
+
+        i: int
+
+        @manualdraw('i')
+        @staticmethod
+        def draw_i(_, __, ___):
+            raise AssertionError
+
+        @manualdraw('i')
+        @staticmethod
+        def draw_i_2(_, __, ___):
+            raise AssertionError
+
+    strategy = instances(A)
+    assert instances(A) is strategy
+    with pytest.raises(ValueError, match=".*referenced by multiple.*"):
+        strategy.validate()
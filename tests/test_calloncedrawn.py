@@ -2,7 +2,6 @@ import pytest
 import sys
 import warnings
 
-from dataclasses import asdict
 from hypothesis import assume, given, HealthCheck, settings
 from hypothesis.strategies import data, DataObject, integers
 from hypothesis.errors import HypothesisDeprecationWarning, \
@@ -18,6 +17,16 @@ from hypothesis_dataclasses import calloncedrawn, dataclass, field_from, \
     instances, PartialInstance
 
 
+FIELDS_LL = frozenset(["ll"])
+"""The fields passed to `call_after_ll` in `test_calloncedrawn_examples`.
+"""
+
+
+FIELDS_IJK = frozenset(['i', 'j', 'k', 'j'])
+"""The fields passed to `called_after_ijk` in
+`test_calloncedrawn_examples`."""
+
+
 def test_calloncedrawn_examples():
     """Tests an example for @calloncedrawn."""
 
@@ -90,7 +99,7 @@ def test_calloncedrawn_examples():
         assert isinstance(x.mm, int)
         assert x.ll > 5
 
-        xpi = asdict(x)
+        xpi = vars(x).copy()
         del xpi["mm"]
 
         nc2 = num_calls_2
@@ -101,10 +110,8 @@ def test_calloncedrawn_examples():
                 "ignore",
                 category=HypothesisDeprecationWarning
             )
-            ExampleDataclass.call_after_ll(
-                frozenset(["ll"]),
-                PartialInstance(**xpi)
-            )
+            pi = PartialInstance.from_mapping(xpi)
+            ExampleDataclass.call_after_ll(FIELDS_LL, pi)
         assert (nc2 + 1) == num_calls_2
 
         del xpi["ll"]
@@ -116,10 +123,8 @@ def test_calloncedrawn_examples():
                 "ignore",
                 category=HypothesisDeprecationWarning
             )
-            ExampleDataclass.called_after_ijk(
-                frozenset(['i', 'j', 'k', 'j']),
-                PartialInstance(**xpi)
-            )
+            pi = PartialInstance.from_mapping(xpi)
+            ExampleDataclass.called_after_ijk(FIELDS_IJK, pi)
         assert (nc + 1) == num_calls
 
     assert num_calls > 0
@@ -3,10 +3,12 @@ import sys
 
 from dataclasses import dataclass as builtin_dataclass, field
 from hypothesis import assume, given, HealthCheck, settings
-from hypothesis.strategies import data, DataObject, floats, integers
-from typing import Union
+from hypothesis.strategies import data, DataObject, DrawFn, floats, \
+    integers
+from typing import FrozenSet, Union
 
-from hypothesis_dataclasses import dataclass, field_from, instances
+from hypothesis_dataclasses import calloncedrawn, dataclass, field_from, \
+    instances, manualdraw, PartialInstance
 
 
 @dataclass
@@ -93,3 +95,51 @@ def test_kw_only_field(value: Union[bool, None], data: DataObject):
     instance = data.draw(instances(ExampleDataclassKWOnlyField))
 
     assert 0 <= instance.i <= 1
+
+
+@dataclass
+class ExampleDataclassClashingNames:
+    """Example dataclass whose field names resemble the names used in the
+    generated draw function. The callbacks ensure that the draw function
+    is actually generated.
+    """
+
+    _cls: int = field_from(integers(0, 1))
+
+    _draw: int = field_from(integers(2, 3))
+
+    _v0: int = field_from(integers(4, 5))
+
+    _PI: int = field_from(integers(8, 9))
+
+    _s0: int = field_from(integers(10, 11))
+
+    draw_instance: int
+
+    @manualdraw("draw_instance", requires=("_cls", "_draw", "_v0"))
+    @staticmethod
+    def draw_draw_instance(
+        draw: DrawFn, field: str, pi: PartialInstance
+    ) -> int:
+        assert pi._PI in (8, 9)
+        assert pi._s0 in (10, 11)
+        return draw(integers(6, 7))
+
+    @calloncedrawn("_cls", "_PI")
+    @staticmethod
+    def check(fields: FrozenSet[str], pi: PartialInstance):
+        assert pi._cls in (0, 1)
+        assert pi._PI in (8, 9)
+
+
+@given(x=instances(ExampleDataclassClashingNames))
+def test_clashing_field_names(x: ExampleDataclassClashingNames):
+    """Test that the field names do not interfere with the names used
+    in the generated draw function.
+    """
+    assert x._cls in (0, 1)
+    assert x._draw in (2, 3)
+    assert x._v0 in (4, 5)
+    assert x.draw_instance in (6, 7)
+    assert x._PI in (8, 9)
+    assert x._s0 in (10, 11)
@@ -1,9 +1,12 @@
 import pytest
+import sys
+import weakref
 
 from dataclasses import dataclass, field, fields
 from hypothesis.strategies import floats
 
-from hypothesis_dataclasses import drawn_fields, field_from, will_draw
+from hypothesis_dataclasses import drawn_fields, field_from, \
+    PartialInstance, will_draw
 
 
 class ExampleDCNoDataclass:
@@ -55,3 +58,56 @@ def test_drawn_fields_raises_no_dataclass():
     """
     with pytest.raises(TypeError, match=".*not a dataclass.*"):
         drawn_fields(ExampleDCNoDataclass)
+
+
+def test_drawn_fields_instance():
+    """Test that the `drawn_fields` helper accepts dataclass instances
+    without modifying them.
+    """
+
+    @dataclass
+    class A:
+        i: int
+
+        j: int = 0
+
+    instance = A(i=0)
+    attrs = vars(instance).copy()
+    assert drawn_fields(instance) == drawn_fields(A) == ('i',)
+    assert vars(instance) == attrs
+
+
+@pytest.mark.skipif(
+    sys.version_info < (3, 10), reason="Test requires slots=True."
+)
+def test_drawn_fields_slots_instance():
+    """Test that the `drawn_fields` helper accepts instances of
+    dataclasses defined with `slots=True`.
+    """
+
+    @dataclass(slots=True)  # type: ignore [call-overload]
+    class S:
+        i: int
+
+        j: int = 0
+
+    assert drawn_fields(S(i=0)) == drawn_fields(S) == ('i',)
+
+
+def test_partial_instance_from_mapping():
+    """Test that `PartialInstance.from_mapping` copies the values of the
+    mapping.
+    """
+    mapping = {"i": 1, "j": 2.0}
+    pi = PartialInstance.from_mapping(mapping)
+    assert isinstance(pi, PartialInstance)
+    assert pi == PartialInstance(**mapping)
+    pi.k = 3
+    assert "k" not in mapping
+
+
+def test_partial_instance_weakref():
+    """Test that weak references to `PartialInstance`s can be created.
+    """
+    pi = PartialInstance(i=1)
+    assert weakref.ref(pi)() is pi
@@ -1,16 +1,12 @@
+import functools
+import inspect
 import pytest
-import sys
 
-from hypothesis import given, HealthCheck, settings
+from hypothesis import example, given, settings
 from hypothesis.strategies import data, DataObject, DrawFn, floats, \
-    integers
+    integers, sampled_from
 from typing import Union
 
-if sys.version_info >= (3, 8):
-    from typing import Literal
-else:
-    from typing_extensions import Literal
-
 from hypothesis_dataclasses import dataclass, field_from, instances, \
     manualdraw, PartialInstance
 
@@ -23,34 +19,30 @@ class ManualDrawExampleDataclass:
 
     j: float  # type: ignore [misc]
 
-    k: int  # type: ignore [misc]
+    k: int = field_from(integers(0, 1))
 
-    @manualdraw('j')
-    @staticmethod
-    def draw_j(draw: DrawFn, field: str, others: PartialInstance) -> float:
+    @manualdraw('j', requires=('i',))
+    @classmethod
+    def draw_j(
+        cls, draw: DrawFn, field: str, others: PartialInstance
+    ) -> float:
         assert field == 'j'
-        assert hasattr(others, 'i')
+        assert not hasattr(others, 'k')
         return draw(floats(-1, 0))
 
-    @manualdraw('k')
-    @classmethod
-    def draw_k(cls, draw: DrawFn, field: str, others: PartialInstance) -> int:
-        assert field == 'k'
-        assert hasattr(others, 'i')
-        assert hasattr(others, 'j')
-        return draw(integers(0, 1))
-
 
 @given(x=instances(ManualDrawExampleDataclass))
-@settings(suppress_health_check=[HealthCheck.filter_too_much])
+@example(x=ManualDrawExampleDataclass(i=0, j=-1.0, k=0))
+@example(x=ManualDrawExampleDataclass(i=5, j=0.0, k=1))
+@settings(max_examples=20)
 def test_manualdraw_example(x: ManualDrawExampleDataclass):
     """Tests for the `ExampleDataclass`."""
     assert 0 <= x.i <= 5
     assert -1 <= x.j <= 0
-    assert x.k in (0, 1)
-    assert isinstance(x.i, int)
-    assert isinstance(x.j, float)
-    assert isinstance(x.k, int)
+    assert x.k in {0, 1}
+    assert type(x.i) is int
+    assert type(x.j) is float
+    assert type(x.k) is int
 
 
 @given(data=data())
@@ -94,82 +86,33 @@ def test_wrapped_instance_method_raises():
                 raise AssertionError
 
 
-@pytest.mark.parametrize("which", ("more", "less"))
-@pytest.mark.parametrize("decorator", (classmethod, staticmethod))
+@pytest.mark.parametrize("func,exp_nparam,nparam", (
+    (staticmethod(lambda: None), 3, 0),
+    (staticmethod(lambda _, __, ___, ____: None), 3, 4),
+    (classmethod(lambda cls: None), 4, 1),
+    (classmethod(lambda cls, _, __, ___, ____: None), 4, 5),
+))
 def test_wrapped_invalid_number_of_arguments(
-    which: Literal["more", "less"],
-    decorator: Union[classmethod, staticmethod]
+    func: Union[classmethod, staticmethod], exp_nparam: int, nparam: int
 ):
     """Test that the functions decorated with @manualdraw must have the
     correct number of arguments.
     """
-    if decorator == staticmethod:
-        exp_nparam = 3
-        if which == "less":
-            nparam = 0
-        elif which == "more":
-            nparam = 4
-        else:
-            raise AssertionError
-    elif decorator == classmethod:
-        exp_nparam = 4
-        if which == "less":
-            nparam = 1
-        elif which == "more":
-            nparam = 5
-        else:
-            raise AssertionError
-    else:
-        raise AssertionError
-
     msg = f".*Expected {exp_nparam}, got {nparam}.*"
     with pytest.raises(TypeError, match=msg):
-
-        @dataclass
-        class _:
-
-            j: float
-
-            if decorator == classmethod:
-
-                if which == "more":
-
-                    def _draw(cls, _, __, ___, ____):
-                        raise AssertionError
-
-                elif which == "less":
-
-                    def _draw(cls):  # type: ignore [misc]
-                        raise AssertionError
-
-            elif decorator == staticmethod:
-
-                if which == "more":
-
-                    def _draw(_, __, ___, ____):  # type: ignore [misc]
-                        raise AssertionError
-
-                elif which == "less":
-
-                    def _draw():  # type: ignore [misc]
-                        raise AssertionError
-
-            func = decorator(_draw)  # type: ignore [operator]
-            draw_j = manualdraw('j')(func)
+        manualdraw('j')(func)
 
 
 def test_incorrectly_applied_decorator_raises():
     """Test that an exception is raised if the decorator is applied
     directly, without specifying the field name.
     """
-    with pytest.raises(RuntimeError, match=".*not a str.*"):
-        @dataclass
-        class _:
 
-            @manualdraw
-            @classmethod
-            def draw(cls, _, __, ___):
-                raise AssertionError
+    def draw(cls, _, __, ___):
+        raise AssertionError
+
+    with pytest.raises(RuntimeError, match=".*not a str.*"):
+        manualdraw(classmethod(draw))  # type: ignore [arg-type]
 
 
 @dataclass
@@ -182,21 +125,19 @@ class ManualDrawMultipleSameFunctionExampleDataclass:
 
     k: int  # type: ignore [misc]
 
-    @manualdraw('j', 'k')
+    @manualdraw('j', 'k', requires=('i',))
     @staticmethod
     def draw_jk(draw: DrawFn, field: str, others: PartialInstance) -> float:
         if field == 'j':
-            assert hasattr(others, 'i')
             return draw(floats(-1, 0))
         elif field == 'k':
-            assert hasattr(others, 'i')
             assert hasattr(others, 'j')
-            return draw(integers(0, 1))
+            return draw(sampled_from((0, 1)))
         raise AssertionError
 
 
 @given(x=instances(ManualDrawMultipleSameFunctionExampleDataclass))
-@settings(suppress_health_check=[HealthCheck.filter_too_much])
+@settings(max_examples=20)
 def test_draw_multiple_fields_same_function(
     x: ManualDrawMultipleSameFunctionExampleDataclass
 ):
@@ -205,10 +146,10 @@ def test_draw_multiple_fields_same_function(
     """
     assert 0 <= x.i <= 5
     assert -1 <= x.j <= 0
-    assert x.k in (0, 1)
-    assert isinstance(x.i, int)
-    assert isinstance(x.j, float)
-    assert isinstance(x.k, int)
+    assert x.k in {0, 1}
+    assert type(x.i) is int
+    assert type(x.j) is float
+    assert type(x.k) is int
 
 
 @dataclass
@@ -224,7 +165,7 @@ class Base:
     @staticmethod
     def draw_base_k(draw: DrawFn, field: str, pi: PartialInstance) -> int:
         assert field == "base_k"
-        return draw(integers(0, 1))
+        return draw(sampled_from((0, 1)))
 
 
 @dataclass
@@ -236,31 +177,31 @@ class DerivedNoOverride(Base):
 
     derived_k: int  # type: ignore [misc]
 
-    @manualdraw("derived_k")
+    @manualdraw("derived_k", requires=("base_k",))
     @staticmethod
     def draw_derived_k(draw: DrawFn, field: str, pi: PartialInstance) -> int:
         assert field == "derived_k"
-        assert hasattr(pi, "base_k")
-        return draw(integers(1, 2))
+        return draw(sampled_from((1, 2)))
 
-    @manualdraw("base_k2")
+    @manualdraw("base_k2", requires=("base_k",))
     @staticmethod
     def draw_derived_k2(draw: DrawFn, field: str, pi: PartialInstance) -> int:
         assert field == "base_k2"
-        assert hasattr(pi, "base_k")
         assert not hasattr(pi, "derived_k")
-        return draw(integers(2, 3))
+        return draw(sampled_from((2, 3)))
 
 
 @given(instance=instances(DerivedNoOverride))
-@settings(suppress_health_check=[HealthCheck.filter_too_much])
+@example(instance=DerivedNoOverride(base_k=0, base_k2=2, derived_k=1))
+@example(instance=DerivedNoOverride(base_k=1, base_k2=3, derived_k=2))
+@settings(max_examples=20)
 def test_manualdraw_inheritance_no_override(instance: DerivedNoOverride):
     """Test that inheritance is compatible with the `manualdraw`
     decorator.
     """
-    assert instance.base_k in (0, 1)
-    assert instance.derived_k in (1, 2)
-    assert instance.base_k2 in (2, 3)
+    assert instance.base_k in {0, 1}
+    assert instance.derived_k in {1, 2}
+    assert instance.base_k2 in {2, 3}
 
 
 @dataclass
@@ -275,15 +216,231 @@ class DerivedWithOverride(Base):
     @staticmethod
     def draw_base_k(draw: DrawFn, field: str, pi: PartialInstance) -> int:
         assert field == "base_k"
-        return draw(integers(3, 4))
+        return draw(sampled_from((3, 4)))
 
 
 @given(instance=instances(DerivedWithOverride))
-@settings(suppress_health_check=[HealthCheck.filter_too_much])
+@example(instance=DerivedWithOverride(base_k=3, base_k2=0, derived_k=0))
+@example(instance=DerivedWithOverride(base_k=4, base_k2=1, derived_k=1))
+@settings(max_examples=20)
 def test_manualdraw_inheritance_with_override(instance: DerivedWithOverride):
     """Test that inheritance is compatible with the `manualdraw`
     decorator and that it is possible to override the draw callbacks in
     derived classes.
     """
-    assert instance.base_k in (3, 4)
-    assert instance.derived_k in (0, 1)
+    assert instance.base_k in {3, 4}
+    assert instance.derived_k in {0, 1}
+
+
+@given(data=data())
+def test_manualdraw_hidden_by_non_descriptor(data: DataObject):
+    """Test that a member of a derived class hides the @manualdraw
+    callback of the same name in the base class.
+    """
+
+    @dataclass
+    class A:
+
+        i: int = field_from(integers(0, 1))
+
+        @manualdraw('i')
+        @staticmethod
+        def draw_i(_, __, ___):
+            raise AssertionError
+
+    @dataclass
+    class B(A):
+
+        draw_i = None
+
+    x = data.draw(instances(B))
+    assert x.i in {0, 1}
+
+
+def test_variadic_parameters_counted():
+    """Test that `*args` and `**kwargs` each count as one parameter of
+    the functions decorated with @manualdraw.
+    """
+
+    def _draw(draw, *args, **kwargs):
+        raise AssertionError
+
+    manualdraw('j')(staticmethod(_draw))
+
+    with pytest.raises(TypeError, match=".*Expected 3, got 2.*"):
+        manualdraw('j')(staticmethod(lambda *args, **kwargs: None))
+
+
+def test_wrapped_function_signature_used():
+    """Test that the signature of the wrapped function is used for
+    functions decorated using `functools.wraps`.
+    """
+
+    def _draw(draw, field, pi):
+        raise AssertionError
+
+    @functools.wraps(_draw)
+    def wrapper(*args, **kwargs):
+        raise AssertionError
+
+    manualdraw('j')(staticmethod(wrapper))
+
+
+def test_bound_method_signature_used():
+    """Test that the bound parameter of a method wrapped in
+    `staticmethod` is not counted.
+    """
+
+    class Helper:
+
+        def draw(self, draw, field, pi):
+            raise AssertionError
+
+    manualdraw('j')(staticmethod(Helper().draw))
+
+
+def test_explicit_signature_used():
+    """Test that the `__signature__` attribute of functions decorated
+    with @manualdraw is respected.
+    """
+
+    def _draw(*args):
+        raise AssertionError
+
+    _draw.__signature__ = inspect.Signature(  # type: ignore [attr-defined]
+        [
+            inspect.Parameter(name, inspect.Parameter.POSITIONAL_ONLY)
+            for name in ("draw", "field", "pi")
+        ]
+    )
+
+    manualdraw('j')(staticmethod(_draw))
+
+
+def test_staticmethod_subclass_accepted():
+    """Test that subclasses of staticmethod can be decorated with
+    @manualdraw.
+    """
+
+    class custom_staticmethod(staticmethod):
+        pass
+
+    def _draw(draw, field, pi):
+        raise AssertionError
+
+    manualdraw('j')(custom_staticmethod(_draw))
+
+    with pytest.raises(TypeError, match=".*Expected 3, got 0.*"):
+        manualdraw('j')(custom_staticmethod(lambda: None))
+
+
+def test_equal_field_sets_shared():
+    """Test that equal field sets passed to @manualdraw are shared
+    between the resulting descriptors.
+    """
+
+    def _draw(draw, field, pi):
+        raise AssertionError
+
+    a = manualdraw('j', 'k')(staticmethod(_draw))
+    b = manualdraw('k', 'j', 'k')(staticmethod(_draw))
+    assert a.fields == {'j', 'k'}
+    assert a.fields is b.fields
+
+
+@given(data=data())
+def test_manualdraw_requires(data: DataObject):
+    """Test that the fields required by a @manualdraw function must be
+    drawn before the fields it draws.
+    """
+
+    @dataclass
+    class A:
+
+        i: int = field_from(integers(0, 5))
+
+        j: int
+
+        @manualdraw('j', requires=('i',))
+        @staticmethod
+        def draw_j(draw: DrawFn, field: str, pi: PartialInstance) -> int:
+            return draw(integers(0, pi.i))
+
+    x = data.draw(instances(A))
+    assert 0 <= x.j <= x.i
+
+    @dataclass
+    class B:
+
+        j: int
+
+        i: int = field_from(integers(0, 5))
+
+        @manualdraw('j', requires=('i',))
+        @staticmethod
+        def draw_j(draw: DrawFn, field: str, pi: PartialInstance) -> int:
+            raise AssertionError
+
+    with pytest.raises(ValueError, match=".*'i' required by.*"):
+        data.draw(instances(B))
+
+    @dataclass
+    class C:
+
+        j: int
+
+        @manualdraw('j', requires=('undefined',))
+        @staticmethod
+        def draw_j(draw: DrawFn, field: str, pi: PartialInstance) -> int:
+            raise AssertionError
+
+    with pytest.raises(AttributeError, match=".*Not a valid.*"):
+        data.draw(instances(C))
+
+
+@given(data=data())
+def test_manualdraw_requires_default_fields(data: DataObject):
+    """Test that the `requires` check of @manualdraw respects fields
+    with default values, which are also passed to the
+    `PartialInstance`.
+    """
+
+    @dataclass
+    class A:
+
+        mode: str = "x"
+
+        i: int = 0
+
+        @manualdraw('i', requires=('mode',))
+        @staticmethod
+        def draw_i(draw: DrawFn, field: str, pi: PartialInstance) -> int:
+            assert pi.mode == "x"
+            return draw(integers(0, 5))
+
+    x = data.draw(instances(A))
+    assert x.mode == "x"
+    assert 0 <= x.i <= 5
+
+    @dataclass
+    class B:
+
+        j: int = 0
+
+        k: int = 1
+
+        @manualdraw('j', requires=('k',))
+        @staticmethod
+        def draw_j(draw: DrawFn, field: str, pi: PartialInstance) -> int:
+            raise AssertionError
+
+    with pytest.raises(ValueError, match=".*'k' required by.*"):
+        data.draw(instances(B))
+
+
+def test_manualdraw_requires_str_raises():
+    """Test that passing a single str as `requires` to @manualdraw
+    raises an exception.
+    """
+    with pytest.raises(TypeError, match=".*'requires' was a str.*"):
+        manualdraw('j', requires='i')
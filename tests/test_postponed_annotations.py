@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from hypothesis import given
+from hypothesis.strategies import integers
+
+from hypothesis_dataclasses import dataclass, field_from, instances
+
+
+@dataclass
+class Inner:
+    """Example dataclass used as the type of a field of `Outer`."""
+
+    value: int = field_from(integers(0, 5))
+
+
+@dataclass
+class Outer:
+    """Example dataclass whose field types are only available as
+    strings due to the postponed evaluation of annotations.
+    """
+
+    inner: Inner
+
+    index: int
+
+
+@given(x=instances(Outer))
+def test_postponed_annotations(x: Outer):
+    """Test that string annotations are resolved to the corresponding
+    types.
+    """
+    assert isinstance(x.inner, Inner)
+    assert isinstance(x.index, int)
+
+
+@dataclass
+class PartiallyUnresolvable:
+    """Example dataclass with an annotation that cannot be resolved."""
+
+    index: int
+
+    value: Undefined = field_from(integers(0, 5))  # noqa: F821
+
+
+@given(x=instances(PartiallyUnresolvable))
+def test_unresolvable_annotations(x: PartiallyUnresolvable):
+    """Test that annotations which cannot be resolved do not prevent
+    drawing instances if the corresponding field has a strategy.
+    """
+    assert isinstance(x.index, int)
+    assert 0 <= x.value <= 5
+
+
+@dataclass
+class FailingAnnotation:
+    """Example dataclass with an annotation whose evaluation raises an
+    exception other than `NameError`.
+    """
+
+    index: int
+
+    value: int | "Undefined" = field_from(integers(0, 5))  # noqa: F821
+
+
+@given(x=instances(FailingAnnotation))
+def test_failing_annotation_evaluation(x: FailingAnnotation):
+    """Test that annotations whose evaluation raises an exception do not
+    prevent drawing instances.
+    """
+    assert isinstance(x.index, int)
+    assert 0 <= x.value <= 5
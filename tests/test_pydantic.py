@@ -1,15 +1,15 @@
+import importlib.util
 import pytest
 
-from hypothesis import given, HealthCheck, settings
-from hypothesis.strategies import data, DataObject, integers
+from hypothesis import example, given, HealthCheck, settings
+from hypothesis.strategies import data, DataObject, DrawFn, integers
 
-from hypothesis_dataclasses import field_from, instances
+from hypothesis_dataclasses import field_from, instances, manualdraw, \
+    PartialInstance
 
-try:
-    import pydantic as _  # type: ignore # noqa: F401
-except ImportError:
-    PYDANTIC_UNAVAILABLE = True
+PYDANTIC_UNAVAILABLE = importlib.util.find_spec("pydantic") is None
 
+if PYDANTIC_UNAVAILABLE:
     # We still have to create dataclasses because instances() requires
     # it. Otherwise the tests would fail before they start when this
     # module is run.
@@ -25,8 +25,6 @@ except ImportError:
         return inner
 
 else:
-    PYDANTIC_UNAVAILABLE = False
-
     from pydantic import field_validator
     from pydantic.dataclasses import dataclass  # type: ignore [no-redef]
 
@@ -46,7 +44,11 @@ class PydanticDataclass:
 
 
 @given(x=instances(PydanticDataclass))
-@settings(suppress_health_check=[HealthCheck.filter_too_much])
+@example(x=PydanticDataclass(i=1))
+@settings(
+    max_examples=20,
+    suppress_health_check=[HealthCheck.filter_too_much]
+)
 @pytest.mark.skipif(PYDANTIC_UNAVAILABLE, reason="Test requires pydantic.")
 def test_pydantic_example(x: PydanticDataclass):
     """Tests for the `PydanticDataclass` testing the pydantic
@@ -78,3 +80,32 @@ def test_pydantic_disabled_exception_passed_through(data: DataObject):
         data.draw(instances(
             PydanticDataclassNeverValid, disable_pydantic=True
         ))
+
+
+@dataclass
+class PydanticDataclassManualDraw:
+    """Example pydantic dataclass with a manually drawn field."""
+
+    i: int
+
+    @manualdraw('i')
+    @staticmethod
+    def draw_i(draw: DrawFn, field: str, pi: PartialInstance) -> int:
+        return draw(integers(0, 1))
+
+    @field_validator('i')
+    @staticmethod
+    def validate_i(value: int) -> int:
+        if value == 0:
+            raise ValueError
+        return value
+
+
+@given(x=instances(PydanticDataclassManualDraw))
+@settings(suppress_health_check=[HealthCheck.filter_too_much])
+@pytest.mark.skipif(PYDANTIC_UNAVAILABLE, reason="Test requires pydantic.")
+def test_pydantic_manualdraw_example(x: PydanticDataclassManualDraw):
+    """Tests for the `PydanticDataclassManualDraw` testing the pydantic
+    validator together with a manually drawn field.
+    """
+    assert x.i == 1